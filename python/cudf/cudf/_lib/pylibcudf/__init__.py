@@ -1,12 +1,22 @@
 # Copyright (c) 2023, NVIDIA CORPORATION.
 
-from . import copying, interop
+import importlib
+
 from .column import Column
 from .gpumemoryview import gpumemoryview
 from .scalar import Scalar
 from .table import Table
 from .types import DataType, TypeId
 
+# Algorithm submodules are imported on first attribute access (PEP 562) so
+# that importing the package only loads the core extension types.
+_SUBMODULES = frozenset(
+    [
+        "copying",
+        "interop",
+    ]
+)
+
 __all__ = [
     "Column",
     "DataType",
@@ -17,3 +27,15 @@ __all__ = [
     "gpumemoryview",
     "interop",
 ]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
@@ -1,6 +1,6 @@
 # Copyright (c) 2019-2023, NVIDIA CORPORATION.
 
-from functools import partial
+from functools import lru_cache, partial
 
 import dask
 
@@ -9,6 +9,12 @@ import cudf
 from dask_cudf.backends import _default_backend
 
 
+@lru_cache(maxsize=4)
+def _read_json_engine(engine):
+    # Reuse the same partial for repeated calls with a given engine string
+    return partial(cudf.read_json, engine=engine)
+
+
 def read_json(url_path, engine="auto", **kwargs):
     """Read JSON data into a :class:`.DataFrame`.
 
@@ -67,9 +73,7 @@ def read_json(url_path, engine="auto", **kwargs):
         dask.dataframe.read_json,
         url_path,
         engine=(
-            partial(cudf.read_json, engine=engine)
-            if isinstance(engine, str)
-            else engine
+            _read_json_engine(engine) if isinstance(engine, str) else engine
         ),
         **kwargs,
     )